@@ -3,11 +3,15 @@
 Ensures every locale dictionary stays synchronized with the English source.
 """
 
+import hashlib
+import json
+import os
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Optional, Union
 
 BASE_LOCALE = "zh-Hans"
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -19,25 +23,86 @@ LOCALES_DIR = (
     / "i18n"
     / "locales"
 )
-
-OBJECT_PATTERN = re.compile(
-    r"const\s+\w+\s*=\s*(\{[\s\S]*?\})\s*as const;",
-    re.MULTILINE,
+# Opt-in key cache for watch/CI loops; files whose stat or content hash is
+# unchanged are not parsed again.
+CACHE_ENV_VAR = "ECHONOTE_I18N_CACHE"
+CACHE_FILE = SCRIPT_DIR.parent / ".cache" / "i18n_keys.json"
+
+OBJECT_START_PATTERN = re.compile(rb"const\s+\w+\s*=\s*\{")
+STRING_PATTERN = re.compile(
+    rb'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|`(?:[^`\\]|\\.)*`'
 )
-KEY_PATTERN = re.compile(r"^\s*([A-Za-z0-9_]+):", re.MULTILINE)
 
 
-def extract_keys_from_file(path: Path) -> List[str]:
-    raw = path.read_text(encoding="utf-8")
-    match = OBJECT_PATTERN.search(raw)
-    if not match:
-        raise ValueError("translation dictionary object is missing or malformed")
-    block = match.group(1)
-    return KEY_PATTERN.findall(block)
+def brace_delta(line: bytes) -> int:
+    # Strip string literals and trailing comments so "{date}" placeholders
+    # do not affect the nesting depth.
+    code = STRING_PATTERN.sub(b"", line).split(b"//", 1)[0]
+    return code.count(b"{") - code.count(b"}")
+
 
+def extract_keys(raw: bytes) -> List[str]:
+    start = OBJECT_START_PATTERN.search(raw)
+    if not start:
+        raise ValueError("translation dictionary object is missing or malformed")
 
-def duplicates_from_list(items: Sequence[str]) -> List[str]:
-    return sorted({item for item, count in Counter(items).items() if count > 1})
+    keys: List[str] = []
+    depth = 1
+    for line in raw[start.end():].splitlines():
+        stripped = line.lstrip()
+        if not stripped or stripped[:1] in b"/*":
+            continue
+        if depth == 1:
+            colon = stripped.find(b":")
+            if colon > 0:
+                name = stripped[:colon].rstrip()
+                if name.replace(b"_", b"").isalnum():
+                    # Interned so every locale shares one object per key name.
+                    keys.append(sys.intern(name.decode("ascii")))
+        if b"{" in stripped or b"}" in stripped:
+            depth += brace_delta(stripped)
+            if depth <= 0:
+                return keys
+    raise ValueError("translation dictionary object is missing or malformed")
+
+
+def _try_extract_keys(
+    path: Path, cached: Optional[dict] = None
+) -> Union[dict, ValueError]:
+    # Return the error instead of raising so the caller can report the file name.
+    # When caching, a matching content hash reuses the cached keys unparsed.
+    raw = path.read_bytes()
+    entry = {}
+    if cached is not None:
+        entry["hash"] = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        if cached.get("hash") == entry["hash"]:
+            entry["keys"] = [sys.intern(key) for key in cached["keys"]]
+            return entry
+    try:
+        entry["keys"] = extract_keys(raw)
+    except ValueError as error:
+        return error
+    return entry
+
+
+def load_key_cache() -> Dict[str, dict]:
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_key_cache(cache: Dict[str, dict]) -> None:
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_FILE.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, CACHE_FILE)
+
+
+def duplicates_from_list(counts: Counter) -> List[str]:
+    # Counter keys are already unique, so no intermediate set is needed.
+    return sorted(item for item, count in counts.items() if count > 1)
 
 
 def format_list(items: Iterable[str]) -> str:
@@ -49,25 +114,60 @@ def check_i18n_keys() -> bool:
         print(f"Error: could not locate {LOCALES_DIR}")
         return False
 
-    locale_files = sorted(
-        path
-        for path in LOCALES_DIR.glob("*.ts")
-        if path.is_file() and path.name != "index.ts"
-    )
+    with os.scandir(LOCALES_DIR) as it:
+        entries = [
+            entry
+            for entry in it
+            if entry.name.endswith(".ts")
+            and entry.name != "index.ts"
+            and entry.is_file(follow_symlinks=False)
+        ]
+    entries.sort(key=lambda entry: entry.name)
+    locale_files = [Path(entry.path) for entry in entries]
 
     if not locale_files:
         print(f"Warning: no locale files found under {LOCALES_DIR}")
         return False
 
-    locale_map = {}
+    use_cache = os.environ.get(CACHE_ENV_VAR) == "1"
+    cache = load_key_cache() if use_cache else {}
+    fresh_cache = {}
+    stale_files = []
+    stale_entries = []
     for path in locale_files:
-        try:
-            locale_map[path.stem] = extract_keys_from_file(path)
-        except ValueError as error:
-            print(f"Error parsing {path.name}: {error}")
-            return False
-
-    base_keys = set(locale_map.get(BASE_LOCALE, []))
+        entry = cache.get(path.stem)
+        if not isinstance(entry, dict) or not isinstance(entry.get("keys"), list):
+            entry = {}
+        if use_cache:
+            stat = path.stat()
+            file_stat = [stat.st_mtime_ns, stat.st_size]
+            if entry.get("stat") == file_stat:
+                entry["keys"] = [sys.intern(key) for key in entry["keys"]]
+                fresh_cache[path.stem] = entry
+                continue
+            fresh_cache[path.stem] = {"stat": file_stat}
+        stale_files.append(path)
+        stale_entries.append(entry if use_cache else None)
+
+    if stale_files:
+        with ThreadPoolExecutor(max_workers=min(32, len(stale_files))) as executor:
+            results = list(
+                executor.map(_try_extract_keys, stale_files, stale_entries)
+            )
+
+        for path, result in zip(stale_files, results):
+            if isinstance(result, ValueError):
+                print(f"Error parsing {path.name}: {result}")
+                return False
+            fresh_cache.setdefault(path.stem, {}).update(result)
+
+        if use_cache:
+            save_key_cache(fresh_cache)
+
+    locale_map = {stem: entry["keys"] for stem, entry in sorted(fresh_cache.items())}
+
+    # dict keeps the base locale's definition order while giving O(1) lookups.
+    base_keys = dict.fromkeys(locale_map.get(BASE_LOCALE, [])).keys()
 
     if not base_keys:
         print(f"Error: base locale '{BASE_LOCALE}' is missing or empty")
@@ -77,7 +177,7 @@ def check_i18n_keys() -> bool:
     print(f"Base locale '{BASE_LOCALE}' defines {len(base_keys)} keys.")
 
     has_errors = False
-    base_duplicates = duplicates_from_list(locale_map[BASE_LOCALE])
+    base_duplicates = duplicates_from_list(Counter(locale_map[BASE_LOCALE]))
     if base_duplicates:
         has_errors = True
         print(
@@ -95,14 +195,17 @@ def check_i18n_keys() -> bool:
         print(f"\nChecking locale '{locale}' ({locale_file.name})")
         locale_has_issues = False
 
-        duplicates = duplicates_from_list(keys)
+        counts = Counter(keys)
+        key_set = counts.keys()
+        duplicates = duplicates_from_list(counts)
         if duplicates:
             locale_has_issues = True
             has_errors = True
             print(f"  - [ERROR] duplicate keys: {format_list(duplicates)}")
 
-        missing = sorted(base_keys - set(keys))
-        extra = sorted(set(keys) - base_keys)
+        # Report in definition order, which is easier for translators to follow.
+        missing = [key for key in base_keys if key not in key_set]
+        extra = [key for key in key_set if key not in base_keys]
 
         if missing:
             locale_has_issues = True
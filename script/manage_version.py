@@ -16,13 +16,20 @@ import argparse
 import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 try:
     import tomllib  # Python 3.11+
 except ModuleNotFoundError as exc:  # pragma: no cover - defensive for older runtimes
     raise SystemExit("Python 3.11+ is required (tomllib missing)") from exc
 
+try:
+    import orjson  # optional fast path
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 PACKAGE_JSON = REPO_ROOT / "package.json"
@@ -35,76 +42,138 @@ SEMVER_RE = re.compile(
     r"(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$"
 )
 
+# Matches `version` only within the [package] table (stops at the next header).
+_CARGO_VERSION_RE = re.compile(
+    r'(?m)^\[package\][^\n]*\n(?:(?!\[)[^\n]*\n)*?version\s*=\s*"([^"]+)"'
+)
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_JSON_VALUE_RE = re.compile(r'\s*:\s*("(?:[^"\\]|\\.)*")')
+
 
 def validate_version(version: str) -> bool:
     """Return True if the string looks like a semver."""
     return bool(SEMVER_RE.match(version))
 
 
-def read_package_version() -> str:
-    with PACKAGE_JSON.open("r", encoding="utf-8") as fp:
-        data = json.load(fp)
+def _find_json_version(content: str) -> re.Match[str] | None:
+    """Locate the top-level "version" string value, ignoring nested objects."""
+    depth = 0
+    for token in _JSON_TOKEN_RE.finditer(content):
+        text = token.group()
+        if text in ("{", "["):
+            depth += 1
+        elif text in ("}", "]"):
+            depth -= 1
+        elif depth == 1 and text == '"version"':
+            value = _JSON_VALUE_RE.match(content, token.end())
+            if value:
+                return value
+    return None
+
+
+def _patch_json_version(path: Path, version: str) -> None:
+    """Replace the "version" value in place, leaving the rest of the file untouched."""
+    content = path.read_text(encoding="utf-8")
+    match = _find_json_version(content)
+    if not match:
+        raise ValueError(f"未找到 {path.name} 中的 version 字段")
+    updated = content[: match.start(1)] + json.dumps(version) + content[match.end(1) :]
+    data = _json_loads(updated.encode("utf-8"))
+    if not isinstance(data, dict) or data.get("version") != version:
+        raise ValueError(f"未能更新 {path.name} 中的 version 字段")
+    path.write_text(updated, encoding="utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_json_version(path: Path) -> str:
+    data = _json_loads(path.read_bytes())
+    if not isinstance(data, dict):
+        raise ValueError(f"未找到 {path.name} 中的 version 字段")
     return str(data.get("version", ""))
 
 
+def read_package_version() -> str:
+    return _read_json_version(PACKAGE_JSON)
+
+
 def write_package_version(version: str) -> None:
-    with PACKAGE_JSON.open("r", encoding="utf-8") as fp:
-        data = json.load(fp)
-    data["version"] = version
-    with PACKAGE_JSON.open("w", encoding="utf-8") as fp:
-        json.dump(data, fp, indent=2, ensure_ascii=False)
-        fp.write("\n")
+    _patch_json_version(PACKAGE_JSON, version)
 
 
 def read_tauri_version() -> str:
-    with TAURI_CONF.open("r", encoding="utf-8") as fp:
-        data = json.load(fp)
-    return str(data.get("version", ""))
+    return _read_json_version(TAURI_CONF)
 
 
 def write_tauri_version(version: str) -> None:
-    with TAURI_CONF.open("r", encoding="utf-8") as fp:
-        data = json.load(fp)
-    data["version"] = version
-    with TAURI_CONF.open("w", encoding="utf-8") as fp:
-        json.dump(data, fp, indent=2, ensure_ascii=False)
-        fp.write("\n")
+    _patch_json_version(TAURI_CONF, version)
 
 
 def read_cargo_version() -> str:
-    with CARGO_TOML.open("rb") as fp:
-        data = tomllib.load(fp)
+    content = CARGO_TOML.read_text(encoding="utf-8")
+    match = _CARGO_VERSION_RE.search(content)
+    if match:
+        return match.group(1)
+    # Fall back to a full parse for layouts the regex does not cover.
+    data = tomllib.loads(content)
     return str(data.get("package", {}).get("version", ""))
 
 
 def write_cargo_version(version: str) -> None:
     content = CARGO_TOML.read_text(encoding="utf-8")
-    updated, count = re.subn(
-        r'(?m)^version\s*=\s*"(.*?)"', f'version = "{version}"', content, count=1
-    )
-    if count == 0:
+    # Use the reader's pattern so only [package].version is ever rewritten.
+    match = _CARGO_VERSION_RE.search(content)
+    if not match:
         raise ValueError("未找到 Cargo.toml 中的 version 字段")
+    updated = content[: match.start(1)] + version + content[match.end(1) :]
     CARGO_TOML.write_text(updated, encoding="utf-8")
 
 
+READERS = {
+    "package.json": read_package_version,
+    "Cargo.toml": read_cargo_version,
+    "tauri.conf.json": read_tauri_version,
+}
+WRITERS = {
+    "package.json": write_package_version,
+    "Cargo.toml": write_cargo_version,
+    "tauri.conf.json": write_tauri_version,
+}
+
+
 def load_versions() -> dict[str, str]:
-    return {
-        "package.json": read_package_version(),
-        "Cargo.toml": read_cargo_version(),
-        "tauri.conf.json": read_tauri_version(),
-    }
+    """Read all version files concurrently, preserving READERS order."""
+    with ThreadPoolExecutor(max_workers=len(READERS)) as executor:
+        results = executor.map(lambda reader: reader(), READERS.values())
+        return dict(zip(READERS, results))
+
+
+def versions_consistent(
+    versions: dict[str, str], valid_versions: set[str] | None = None
+) -> bool:
+    """Return True if all non-empty versions are identical and valid semver."""
+    unique_versions = {ver for ver in versions.values() if ver}
+    if valid_versions is None:
+        valid_versions = {ver for ver in unique_versions if validate_version(ver)}
+    return len(unique_versions) == 1 and unique_versions <= valid_versions
 
 
 def print_status(versions: dict[str, str]) -> bool:
+    # Validate each distinct version once instead of once per file.
+    valid_versions = {
+        ver for ver in set(versions.values()) if ver and validate_version(ver)
+    }
+
     print("\n当前版本状态：")
     for name, ver in versions.items():
-        flag = "OK" if validate_version(ver) else "非法"
+        flag = "OK" if ver in valid_versions else "非法"
         print(f"- {name:20} {ver or '[缺失]'} ({flag})")
 
-    unique_versions = {ver for ver in versions.values() if ver}
-    consistent = len(unique_versions) == 1 and all(
-        validate_version(v) for v in unique_versions
-    )
+    consistent = versions_consistent(versions, valid_versions)
     if consistent:
         print("所有文件版本号一致且合法。")
     else:
@@ -127,18 +196,36 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="仅验证合法性与一致性；不一致时退出码为 1，便于 CI 使用。",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--verify-after-write",
+        action="store_true",
+        help=(
+            "配合 --set 使用：写入后重新读取所有文件以确认版本号；"
+            "--set 与 --check 同用时总会重新读取。"
+        ),
+    )
+    args = parser.parse_args()
+    if args.verify_after_write and not args.new_version:
+        parser.error("--verify-after-write 需要与 --set 一起使用。")
+    return args
 
 
 def update_all_versions(new_version: str) -> None:
-    write_package_version(new_version)
-    write_cargo_version(new_version)
-    write_tauri_version(new_version)
+    for writer in WRITERS.values():
+        writer(new_version)
 
 
 def main() -> None:
     args = parse_args()
     versions = load_versions()
+
+    if args.check and not args.new_version:
+        # CI only needs the exit code; print details only when the check fails.
+        if versions_consistent(versions):
+            sys.exit(0)
+        print_status(versions)
+        sys.exit(1)
+
     consistent = print_status(versions)
 
     if args.new_version:
@@ -146,7 +233,11 @@ def main() -> None:
             sys.exit("提供的版本号格式非法，请输入有效的 semver（例：1.2.3、1.2.3-beta.1）。")
         update_all_versions(args.new_version)
         print(f"\n已更新版本号为 {args.new_version}。")
-        versions = load_versions()
+        # CI results must reflect what the readers see, not what was intended.
+        if args.verify_after_write or args.check:
+            versions = load_versions()
+        else:
+            versions = {name: args.new_version for name in versions}
         consistent = print_status(versions)
 
     if args.check: